@@ -1,218 +1,356 @@
+import csv
 import re
-import pandas as pd
-import pdfplumber
+import zipfile
+import numpy as np
 import streamlit as st
-from io import BytesIO
+import xlsxwriter
+import pdf_text
+from functools import partial
+from io import BytesIO, TextIOWrapper
 
-def extract_pdf_text(file_stream):
+# Bounds for the Streamlit caches, which are shared by every session on the
+# server: keep only a few recent uploads, and drop them after an hour.
+CACHE_MAX_ENTRIES = 4
+CACHE_TTL = "1h"
+
+# Regex patterns are compiled once at import time instead of on every block.
+# One alternation covers both record markers and all of their fields so the
+# whole document is scanned in a single pass; the named group that matched
+# tells which field was found, and fields are assigned to the most recent
+# marker of their record type.
+# The leading lookahead on the keywords' first letters lets the engine reject
+# most positions with a single character test before trying any alternative.
+# There is deliberately no word boundary: PDF text often glues a keyword to the
+# token before it (e.g. "Page 1Proposal Proxy Year:").
+_RE_FIELDS = re.compile(
+    r'(?=[pfawbdi])(?:'
+    r'(?P<proposal>Proposal\s+Proxy\s+Year:)'
+    r'|For\s*votes\s*[:-]?\s*(?P<for>[\d,]+)'
+    r'|Against\s*votes\s*[:-]?\s*(?P<against>[\d,]+)'
+    r'|Abstained\s*votes\s*[:-]?\s*(?P<abstained>[\d,]+)'
+    r'|Withheld\s*votes\s*[:-]?\s*(?P<withheld>[\d,]+)'
+    r'|Broker\s*Non[-\s]*Votes\s*[:-]?\s*(?P<broker>[\d,]+|Nil|-)'
+    # The quoted text may not run past a record marker, so a missing or curly
+    # closing quote cannot swallow the records that follow
+    r'|Proposal\s*Text\s*[:-]?\s*"(?P<text>(?:(?!Proposal\s+Proxy\s+Year:|Individual:)[^"])+)"'
+    r'|(?P<individual>Individual:)'
+    r'|Director\s*Votes\s*For\s*[:-]?\s*(?P<director_for>[\d,]+)'
+    r'|Director\s*Votes\s*Against\s*[:-]?\s*(?P<director_against>[\d,]+)'
+    r'|Director\s*Votes\s*Abstained\s*[:-]?\s*(?P<director_abstained>[\d,]+)'
+    r'|Director\s*Votes\s*Withheld\s*[:-]?\s*(?P<director_withheld>[\d,]+)'
+    r'|Director\s*Votes\s*Broker[-\s]*Non[-\s]*Votes\s*[:-]?\s*(?P<director_broker>[\d,]+|Nil|-)'
+    r')',
+    re.IGNORECASE)
+_RE_YEAR = re.compile(r'\s*(\d{4})')
+_RE_NAME = re.compile(r'\s*([^\n]+)')
+# The year and name lookups may not read past the next marker of their record type
+_RE_PROPOSAL_MARKER = re.compile(r'Proposal\s+Proxy\s+Year:', re.IGNORECASE)
+_RE_INDIVIDUAL_MARKER = re.compile(r'Individual:', re.IGNORECASE)
+_PROPOSAL_FIELDS = {
+    'for': 'Vote Results - For',
+    'against': 'Vote Results - Against',
+    'abstained': 'Vote Results - Abstained',
+    'withheld': 'Vote Results - Withheld',
+    'broker': 'Vote Results - Broker Non-Votes',
+    'text': 'Proposal Text',
+}
+_DIRECTOR_FIELDS = {
+    'director_for': 'Director Votes For',
+    'director_against': 'Director Votes Against',
+    'director_abstained': 'Director Votes Abstained',
+    'director_withheld': 'Director Votes Withheld',
+    'director_broker': 'Director Votes Broker-Non-Votes',
+}
+
+# Place values for folding vote-count digits. Any 18-digit count fits in int64;
+# longer runs (e.g. adjacent number cells merged by the PDF text) are parsed
+# with Python ints instead.
+_MAX_FOLD_DIGITS = 18
+_POWERS_OF_TEN = 10 ** np.arange(_MAX_FOLD_DIGITS, dtype=np.int64)
+
+# Output columns, in sheet order.
+PROPOSAL_COLUMNS = [
+    'Proposal Proxy Year',
+    'Resolution Outcome',
+    'Proposal Text',
+    'Mgmt. Proposal Category',
+    'Vote Results - For',
+    'Vote Results - Against',
+    'Vote Results - Abstained',
+    'Vote Results - Withheld',
+    'Vote Results - Broker Non-Votes',
+    'Proposal Vote Results Total'
+]
+DIRECTOR_COLUMNS = [
+    'Director Election Year',
+    'Individual',
+    'Director Votes For',
+    'Director Votes Against',
+    'Director Votes Abstained',
+    'Director Votes Withheld',
+    'Director Votes Broker-Non-Votes'
+]
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL)
+def extract_pdf_text(pdf_bytes):
+    """
+    Extracts text from the given PDF file contents using pdfplumber.
+    See pdf_text.extract_text for how longer documents are parallelized.
     """
-    Extracts text from the given PDF file stream using pdfplumber.
+    return pdf_text.extract_text(pdf_bytes)
+
+def _votes_to_int(values):
     """
-    all_text = ""
-    with pdfplumber.open(file_stream) as pdf:
-        for page in pdf.pages:
-            text = page.extract_text()
-            if text:
-                all_text += text + "\n"
-    return all_text
+    Converts captured vote counts such as "1,234,567" to an int64 array in one
+    vectorized step. Blank values and values without digits ("Nil", "-") count
+    as zero.
+    
+    The digits are folded straight from the character codes: each digit is
+    weighted by 10 to the number of digits to its right, and commas and padding
+    are masked out, so no comma-stripped copy of any string is built.
+    
+    The fold only knows ASCII digits. Values with more than _MAX_FOLD_DIGITS
+    digits, or with any non-ASCII character (the patterns' digit class also
+    captures e.g. Arabic-Indic or full-width digits), are parsed with int()
+    instead, and an object array of Python ints is returned.
+    """
+    if not values:
+        return np.zeros(0, dtype=np.int64)
+    chars = np.array(values, dtype=str)
+    codes = chars.view(np.uint32).reshape(len(values), -1)
+    # Non-digit code points wrap around to large values after the subtraction
+    digits = codes - np.uint32(ord("0"))
+    is_digit = digits <= 9
+    places = np.cumsum(is_digit[:, ::-1], axis=1)[:, ::-1] - is_digit
+    needs_int = (is_digit.sum(axis=1) > _MAX_FOLD_DIGITS) | (codes > 127).any(axis=1)
+    # Clipped so overlong rows index the table safely; they are replaced below
+    places = np.minimum(places, _MAX_FOLD_DIGITS - 1)
+    counts = (np.where(is_digit, digits, 0) * _POWERS_OF_TEN[places]).sum(axis=1)
+    if needs_int.any():
+        counts = counts.astype(object)
+        for i in np.flatnonzero(needs_int):
+            counts[i] = int(values[i].replace(",", ""))
+    return counts
 
-def parse_proposals(text):
+def _convert_vote_columns(data, columns):
     """
-    Parses the AGM proposal data from the extracted text.
+    Converts the given columns of captured vote counts in `data` to integers in
+    place, so they are written as numeric Excel cells. Blank values become None
+    and are left as empty cells; Broker Non-Votes given as "Nil" or "-" have no
+    digits and become zero.
+    
+    All columns go through a single _votes_to_int call. Returns the counts as a
+    (columns, rows) array, with blanks as zero.
+    """
+    rows = len(data[columns[0]])
+    counts = _votes_to_int([val for column in columns for val in data[column]]).reshape(len(columns), rows)
+    for column, column_counts in zip(columns, counts.tolist()):
+        data[column] = [count if val else None for val, count in zip(data[column], column_counts)]
+    return counts
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL)
+def parse_document(text):
+    """
+    Parses the AGM proposal data and the director election results from the
+    extracted text in a single scan.
     
     Expected fields for each proposal:
       - Proposal Proxy Year
       - Resolution Outcome (Approved if For votes > Against votes)
       - Proposal Text (extracted text enclosed in double quotes)
       - Mgmt. Proposal Category (left blank)
-      - Vote Results - For
+      - Vote Results - For (vote counts are returned as integers, None if missing)
       - Vote Results - Against
       - Vote Results - Abstained
       - Vote Results - Withheld
       - Vote Results - Broker Non-Votes (if 'Nil' or '-' then consider as zero)
       - Proposal Vote Results Total (left blank)
     
-    Adjust regex patterns as needed to match your PDF's structure.
-    """
-    proposals = []
-    # Assuming each proposal starts with "Proposal Proxy Year:" (case-insensitive)
-    proposal_blocks = re.split(r'Proposal\s+Proxy\s+Year:', text, flags=re.IGNORECASE)
-    
-    for block in proposal_blocks[1:]:
-        proposal = {}
-        # Extract Proposal Proxy Year (assuming a 4-digit year at the beginning)
-        m_year = re.match(r'\s*(\d{4})', block)
-        proposal['Proposal Proxy Year'] = m_year.group(1) if m_year else ""
-        
-        # Extract Vote Results - For
-        m_for = re.search(r'For\s*votes\s*[:\-]?\s*([\d,]+)', block, flags=re.IGNORECASE)
-        proposal['Vote Results - For'] = m_for.group(1) if m_for else ""
-        
-        # Extract Vote Results - Against
-        m_against = re.search(r'Against\s*votes\s*[:\-]?\s*([\d,]+)', block, flags=re.IGNORECASE)
-        proposal['Vote Results - Against'] = m_against.group(1) if m_against else ""
-        
-        # Extract Vote Results - Abstained
-        m_abstained = re.search(r'Abstained\s*votes\s*[:\-]?\s*([\d,]+)', block, flags=re.IGNORECASE)
-        proposal['Vote Results - Abstained'] = m_abstained.group(1) if m_abstained else ""
-        
-        # Extract Vote Results - Withheld
-        m_withheld = re.search(r'Withheld\s*votes\s*[:\-]?\s*([\d,]+)', block, flags=re.IGNORECASE)
-        proposal['Vote Results - Withheld'] = m_withheld.group(1) if m_withheld else ""
-        
-        # Extract Vote Results - Broker Non-Votes (treat "Nil" or "-" as zero)
-        m_broker = re.search(r'Broker\s*Non[-\s]*Votes\s*[:\-]?\s*([\d,]+|Nil|-)', block, flags=re.IGNORECASE)
-        if m_broker:
-            val = m_broker.group(1)
-            proposal['Vote Results - Broker Non-Votes'] = "0" if val in ["Nil", "-"] else val
-        else:
-            proposal['Vote Results - Broker Non-Votes'] = ""
-        
-        # Extract Proposal Text (assuming it is enclosed in double quotes)
-        m_text = re.search(r'Proposal\s*Text\s*[:\-]?\s*"([^"]+)"', block, flags=re.IGNORECASE)
-        proposal['Proposal Text'] = m_text.group(1) if m_text else ""
-        
-        # Calculate Resolution Outcome: Approved if For votes > Against votes.
-        try:
-            for_votes = int(proposal['Vote Results - For'].replace(",", "")) if proposal['Vote Results - For'] else 0
-        except Exception:
-            for_votes = 0
-        try:
-            against_votes = int(proposal['Vote Results - Against'].replace(",", "")) if proposal['Vote Results - Against'] else 0
-        except Exception:
-            against_votes = 0
-        if for_votes > against_votes:
-            proposal['Resolution Outcome'] = f"Approved ({proposal['Vote Results - For']} For > {proposal['Vote Results - Against']} Against)"
-        else:
-            proposal['Resolution Outcome'] = ""
-        
-        # Mgmt. Proposal Category (left blank)
-        proposal['Mgmt. Proposal Category'] = ""
-        # Proposal Vote Results Total (left blank)
-        proposal['Proposal Vote Results Total'] = ""
-        
-        proposals.append(proposal)
-    return proposals
-
-def parse_directors(text):
-    """
-    Parses the director election results from the extracted text.
-    
     Expected fields for each director:
       - Director Election Year (fixed as 2024)
       - Individual (director name)
-      - Director Votes For
+      - Director Votes For (vote counts are returned as integers, None if missing)
       - Director Votes Against (blank if not available)
       - Director Votes Abstained (blank if not available)
       - Director Votes Withheld
       - Director Votes Broker-Non-Votes (if 'Nil' or '-' then consider as zero)
     
+    Returns a (proposals, directors) tuple; each is a dict mapping every output
+    column to its list of values.
+    
     Adjust regex patterns as needed to match your PDF's structure.
     """
-    directors = []
-    # Assuming each director block starts with "Individual:" (case-insensitive)
-    director_blocks = re.split(r'Individual:', text, flags=re.IGNORECASE)
-    
-    for block in director_blocks[1:]:
-        director = {}
-        director['Director Election Year'] = "2024"
-        
-        # Extract the director's name (up to the first newline)
-        m_name = re.match(r'\s*([^\n]+)', block)
-        director['Individual'] = m_name.group(1).strip() if m_name else ""
-        
-        # Extract Director Votes For
-        m_for = re.search(r'Director\s*Votes\s*For\s*[:\-]?\s*([\d,]+)', block, flags=re.IGNORECASE)
-        director['Director Votes For'] = m_for.group(1) if m_for else ""
-        
-        # Extract Director Votes Against
-        m_against = re.search(r'Director\s*Votes\s*Against\s*[:\-]?\s*([\d,]+)', block, flags=re.IGNORECASE)
-        director['Director Votes Against'] = m_against.group(1) if m_against else ""
-        
-        # Extract Director Votes Abstained
-        m_abstained = re.search(r'Director\s*Votes\s*Abstained\s*[:\-]?\s*([\d,]+)', block, flags=re.IGNORECASE)
-        director['Director Votes Abstained'] = m_abstained.group(1) if m_abstained else ""
-        
-        # Extract Director Votes Withheld
-        m_withheld = re.search(r'Director\s*Votes\s*Withheld\s*[:\-]?\s*([\d,]+)', block, flags=re.IGNORECASE)
-        director['Director Votes Withheld'] = m_withheld.group(1) if m_withheld else ""
-        
-        # Extract Director Votes Broker-Non-Votes (treat "Nil" or "-" as zero)
-        m_broker = re.search(r'Director\s*Votes\s*Broker[-\s]*Non[-\s]*Votes\s*[:\-]?\s*([\d,]+|Nil|-)', block, flags=re.IGNORECASE)
-        if m_broker:
-            val = m_broker.group(1)
-            director['Director Votes Broker-Non-Votes'] = "0" if val in ["Nil", "-"] else val
+    # Records are collected column-wise: one list per output column.
+    proposals = {column: [] for column in PROPOSAL_COLUMNS}
+    directors = {column: [] for column in DIRECTOR_COLUMNS}
+    # Each field group resolves straight to the column list it fills, so routing
+    # a match is a single dict lookup.
+    field_columns = {field: proposals[column] for field, column in _PROPOSAL_FIELDS.items()}
+    field_columns.update({field: directors[column] for field, column in _DIRECTOR_FIELDS.items()})
+    # Each proposal starts with "Proposal Proxy Year:" and each director block
+    # with "Individual:" (case-insensitive); any field matched before the first
+    # marker of its record type is ignored. Only the first occurrence of each
+    # field within a record is kept.
+    for m in _RE_FIELDS.finditer(text):
+        field = m.lastgroup
+        if field == 'proposal':
+            for column in _PROPOSAL_FIELDS.values():
+                proposals[column].append("")
+            # Extract Proposal Proxy Year (assuming a 4-digit year right after the marker)
+            m_next = _RE_PROPOSAL_MARKER.search(text, m.end())
+            m_year = _RE_YEAR.match(text, m.end(), m_next.start() if m_next else len(text))
+            proposals['Proposal Proxy Year'].append(m_year.group(1) if m_year else "")
+        elif field == 'individual':
+            for column in _DIRECTOR_FIELDS.values():
+                directors[column].append("")
+            directors['Director Election Year'].append("2024")
+            # Extract the director's name (up to the first newline)
+            m_next = _RE_INDIVIDUAL_MARKER.search(text, m.end())
+            m_name = _RE_NAME.match(text, m.end(), m_next.start() if m_next else len(text))
+            directors['Individual'].append(m_name.group(1).strip() if m_name else "")
         else:
-            director['Director Votes Broker-Non-Votes'] = ""
-        
-        directors.append(director)
-    return directors
+            # A field column is empty until the first marker of its record type
+            column = field_columns[field]
+            if column and not column[-1]:
+                column[-1] = m[field]
+    
+    _finish_proposals(proposals)
+    _finish_directors(directors)
+    return proposals, directors
+
+def _finish_proposals(proposals):
+    """
+    Fills in the derived proposal columns and converts the vote counts in place.
+    Broker Non-Votes of "Nil" or "-" become zero.
+    """
+    # The outcome text quotes the vote counts as printed, so keep the raw strings
+    for_col = proposals['Vote Results - For']
+    against_col = proposals['Vote Results - Against']
+    counts = _convert_vote_columns(proposals, [
+        'Vote Results - For', 'Vote Results - Against', 'Vote Results - Abstained',
+        'Vote Results - Withheld', 'Vote Results - Broker Non-Votes'
+    ])
+    
+    # Calculate Resolution Outcome for all proposals at once: Approved if For votes > Against votes.
+    approved = counts[0] > counts[1]
+    proposals['Resolution Outcome'] = [
+        f"Approved ({for_val} For > {against_val} Against)" if is_approved else ""
+        for for_val, against_val, is_approved in zip(for_col, against_col, approved)
+    ]
+    
+    count = len(proposals['Proposal Proxy Year'])
+    # Mgmt. Proposal Category (left blank)
+    proposals['Mgmt. Proposal Category'] = [""] * count
+    # Proposal Vote Results Total (left blank)
+    proposals['Proposal Vote Results Total'] = [""] * count
 
+def _finish_directors(directors):
+    """
+    Converts the director vote counts in place. Broker-Non-Votes of "Nil" or "-"
+    become zero.
+    """
+    _convert_vote_columns(directors, list(_DIRECTOR_FIELDS.values()))
+
+def _write_sheet(workbook, sheet_name, columns, data, header_format):
+    """
+    Writes one sheet: a header row followed by the rows of the column-wise `data`,
+    strictly in row order as required by xlsxwriter's constant_memory mode.
+    """
+    worksheet = workbook.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, columns, header_format)
+    for row, values in enumerate(zip(*(data[column] for column in columns)), start=1):
+        worksheet.write_row(row, 0, values)
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL)
 def save_to_excel(proposals, directors):
     """
     Saves the proposals and director election data to an Excel file with two sheets.
-    Returns a BytesIO stream containing the Excel file.
-    """
-    proposals_df = pd.DataFrame(proposals, columns=[
-        'Proposal Proxy Year',
-        'Resolution Outcome',
-        'Proposal Text',
-        'Mgmt. Proposal Category',
-        'Vote Results - For',
-        'Vote Results - Against',
-        'Vote Results - Abstained',
-        'Vote Results - Withheld',
-        'Vote Results - Broker Non-Votes',
-        'Proposal Vote Results Total'
-    ])
+    Both are expected column-wise, as returned by parse_document.
+    Returns the contents of the Excel file as bytes.
     
-    directors_df = pd.DataFrame(directors, columns=[
-        'Director Election Year',
-        'Individual',
-        'Director Votes For',
-        'Director Votes Against',
-        'Director Votes Abstained',
-        'Director Votes Withheld',
-        'Director Votes Broker-Non-Votes'
-    ])
+    Rows are streamed straight to the workbook with xlsxwriter in constant_memory
+    mode, so only the current row is held in memory and no DataFrame is built.
+    """
+    output = BytesIO()
+    workbook = xlsxwriter.Workbook(output, {'constant_memory': True})
+    # Same header style pandas uses for to_excel
+    header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+    _write_sheet(workbook, 'Proposal Sheet', PROPOSAL_COLUMNS, proposals, header_format)
+    _write_sheet(workbook, 'Non-Proposal Sheet', DIRECTOR_COLUMNS, directors, header_format)
+    workbook.close()
+    return output.getvalue()
+
+def _write_csv(zip_file, name, columns, data):
+    """
+    Writes one CSV member: a header row followed by the rows of the column-wise `data`.
+    """
+    with zip_file.open(name, 'w') as member, TextIOWrapper(member, encoding='utf-8', newline='') as stream:
+        writer = csv.writer(stream)
+        writer.writerow(columns)
+        writer.writerows(zip(*(data[column] for column in columns)))
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL)
+def save_to_csv_zip(proposals, directors):
+    """
+    Saves the proposals and director election data as two CSV files in a zip archive.
+    Both are expected column-wise, as returned by parse_document.
+    Returns the contents of the zip archive as bytes.
     
+    A faster, lighter alternative to the Excel export when xlsx is not required.
+    """
     output = BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        proposals_df.to_excel(writer, sheet_name='Proposal Sheet', index=False)
-        directors_df.to_excel(writer, sheet_name='Non-Proposal Sheet', index=False)
-    output.seek(0)
-    return output
+    with zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        _write_csv(zip_file, 'proposals.csv', PROPOSAL_COLUMNS, proposals)
+        _write_csv(zip_file, 'directors.csv', DIRECTOR_COLUMNS, directors)
+    return output.getvalue()
 
-# Streamlit interface
-st.title("AGM Data Extractor")
+def main():
+    """
+    Streamlit interface. Kept out of module level so that importing this file,
+    e.g. when a spawned extraction worker re-imports the main script, does not
+    render the app.
+    """
+    st.title("AGM Data Extractor")
 
-st.markdown("""
-Upload your AGM PDF result document. The script will extract proposal and director election data and generate an Excel file with two sheets.
+    st.markdown("""
+Upload your AGM PDF result document. The script will extract proposal and director election data and generate an Excel file with two sheets (also available as a zip of CSV files).
 """)
 
-uploaded_file = st.file_uploader("Upload PDF file", type="pdf")
+    uploaded_file = st.file_uploader("Upload PDF file", type="pdf")
 
-if uploaded_file is not None:
-    st.info("Processing the PDF file...")
-    # Extract text from the uploaded PDF file
-    pdf_text = extract_pdf_text(uploaded_file)
-    
-    # Parse proposals and directors from the extracted text
-    proposals = parse_proposals(pdf_text)
-    directors = parse_directors(pdf_text)
-    
-    if not proposals:
-        st.warning("No proposals were found in the document.")
-    if not directors:
-        st.warning("No director election results were found in the document.")
-    
-    # Save the data to an Excel file in memory
-    excel_data = save_to_excel(proposals, directors)
-    
-    st.success("Data extraction complete!")
-    st.download_button(
-        label="Download Excel File",
-        data=excel_data,
-        file_name="agm_data.xlsx",
-        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-    )
+    if uploaded_file is not None:
+        st.info("Processing the PDF file...")
+        # Extract text from the uploaded PDF file. Streamlit reruns this script on every
+        # interaction; extraction, parsing and the exports are cached on their
+        # inputs, so the same upload is only processed once.
+        pdf_bytes = uploaded_file.getvalue()
+        pdf_text = extract_pdf_text(pdf_bytes)
+        
+        # Parse proposals and directors from the extracted text
+        proposals, directors = parse_document(pdf_text)
+        
+        if not proposals['Proposal Proxy Year']:
+            st.warning("No proposals were found in the document.")
+        if not directors['Individual']:
+            st.warning("No director election results were found in the document.")
+        
+        # Save the data to an Excel file in memory
+        excel_data = save_to_excel(proposals, directors)
+        
+        st.success("Data extraction complete!")
+        st.download_button(
+            label="Download Excel File",
+            data=excel_data,
+            file_name="agm_data.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        )
+        st.download_button(
+            label="Download CSV Files (zip)",
+            # Built only when the button is clicked
+            data=partial(save_to_csv_zip, proposals, directors),
+            file_name="agm_data.zip",
+            mime="application/zip"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+import csv
+import zipfile
+import xml.etree.ElementTree as ET
+from io import BytesIO
+
+from extract_document import DIRECTOR_COLUMNS, PROPOSAL_COLUMNS, parse_document, save_to_csv_zip, save_to_excel
+
+_XLSX_NS = {'x': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
+
+
+def _sheet_cells(archive, name):
+    """Returns {cell reference: value} for a worksheet; numbers as int, strings as str."""
+    cells = {}
+    for cell in ET.fromstring(archive.read(name)).iterfind('.//x:c', _XLSX_NS):
+        if cell.get('t') == 'inlineStr':
+            cells[cell.get('r')] = cell.find('x:is/x:t', _XLSX_NS).text
+        else:
+            cells[cell.get('r')] = int(cell.find('x:v', _XLSX_NS).text)
+    return cells
+
+
+def test_unterminated_proposal_text_does_not_swallow_next_proposal():
+    text = (
+        'Proposal Proxy Year: 2024\n'
+        'Proposal Text: "Approve the auditor”\n'
+        'For votes: 10\n'
+        'Proposal Proxy Year: 2024\n'
+        'Proposal Text: "Elect the board"\n'
+        'For votes: 20\n'
+        'Proposal Proxy Year: 2024\n'
+        'Proposal Text: "Amend the charter"\n'
+        'For votes: 30\n'
+    )
+    proposals, _ = parse_document(text)
+    assert proposals['Vote Results - For'] == [10, 20, 30]
+    assert proposals['Proposal Text'] == ["", "Elect the board", "Amend the charter"]
+
+
+def test_unterminated_proposal_text_does_not_swallow_director():
+    text = (
+        'Proposal Proxy Year: 2024\n'
+        'Proposal Text: "Approve the auditor\n'
+        'For votes: 10\n'
+        'Individual: Jane Doe\n'
+        'Director Votes For: 1,000\n'
+        'Individual: John Roe "Jr."\n'
+    )
+    proposals, directors = parse_document(text)
+    assert proposals['Vote Results - For'] == [10]
+    assert proposals['Proposal Text'] == [""]
+    assert directors['Individual'] == ["Jane Doe", 'John Roe "Jr."']
+    assert directors['Director Votes For'] == [1000, None]
+
+
+def test_overlong_vote_counts_are_parsed_exactly():
+    text = (
+        'Proposal Proxy Year: 2024\n'
+        'For votes: 1,234,567,890,123,456,789,012\n'
+        'Against votes: 9999999999999999999\n'
+        'Abstained votes: 999,999,999,999,999,999\n'
+    )
+    proposals, _ = parse_document(text)
+    assert proposals['Vote Results - For'] == [1234567890123456789012]
+    assert proposals['Vote Results - Against'] == [9999999999999999999]
+    assert proposals['Vote Results - Abstained'] == [999999999999999999]
+    assert proposals['Resolution Outcome'][0].startswith("Approved (")
+
+
+def test_keywords_glued_to_preceding_text_are_found():
+    text = 'Page 1Proposal Proxy Year: 2024\nResultsFor votes: 10\n'
+    proposals, _ = parse_document(text)
+    assert proposals['Proposal Proxy Year'] == ["2024"]
+    assert proposals['Vote Results - For'] == [10]
+
+
+def test_non_ascii_digit_vote_counts_are_parsed():
+    text = (
+        'Proposal Proxy Year: 2024\n'
+        'For votes: ٣٤\n'
+        'Against votes: 5\n'
+        'Abstained votes: １,２３\n'
+    )
+    proposals, _ = parse_document(text)
+    assert proposals['Vote Results - For'] == [34]
+    assert proposals['Vote Results - Against'] == [5]
+    assert proposals['Vote Results - Abstained'] == [123]
+    assert proposals['Resolution Outcome'] == ["Approved (٣٤ For > 5 Against)"]
+
+
+def test_director_name_does_not_read_into_next_record():
+    text = (
+        'Individual:\n'
+        'Individual: B\n'
+        'Individual:\n'
+        'Jane Doe\n'
+    )
+    _, directors = parse_document(text)
+    assert directors['Individual'] == ["", "B", "Jane Doe"]
+
+
+def test_proxy_year_does_not_read_into_next_record():
+    text = 'Proposal Proxy Year:\nProposal Proxy Year: 2024\n'
+    proposals, _ = parse_document(text)
+    assert proposals['Proposal Proxy Year'] == ["", "2024"]
+
+
+def test_save_to_csv_zip_writes_both_tables():
+    text = (
+        'Proposal Proxy Year: 2024\n'
+        'Proposal Text: "Elect the board"\n'
+        'For votes: 1,000\n'
+        'Against votes: 10\n'
+        'Individual: Jane Doe\n'
+        'Director Votes For: 500\n'
+        'Director Votes Broker Non-Votes: Nil\n'
+    )
+    archive = zipfile.ZipFile(BytesIO(save_to_csv_zip(*parse_document(text))))
+    assert archive.namelist() == ['proposals.csv', 'directors.csv']
+    proposals = list(csv.reader(archive.read('proposals.csv').decode('utf-8').splitlines()))
+    directors = list(csv.reader(archive.read('directors.csv').decode('utf-8').splitlines()))
+    assert proposals == [
+        PROPOSAL_COLUMNS,
+        ['2024', 'Approved (1,000 For > 10 Against)', 'Elect the board', '', '1000', '10', '', '', '', ''],
+    ]
+    assert directors == [
+        DIRECTOR_COLUMNS,
+        ['2024', 'Jane Doe', '500', '', '', '', '0'],
+    ]
+
+
+def test_fields_before_first_marker_are_ignored():
+    text = (
+        'For votes: 99\n'
+        'Director Votes For: 99\n'
+        'Proposal Proxy Year: 2024\n'
+        'Against votes: 5\n'
+        'Individual: Jane Doe\n'
+    )
+    proposals, directors = parse_document(text)
+    assert proposals['Vote Results - For'] == [None]
+    assert proposals['Vote Results - Against'] == [5]
+    assert directors['Director Votes For'] == [None]
+
+
+def test_only_first_occurrence_of_a_field_is_kept():
+    text = (
+        'Proposal Proxy Year: 2024\n'
+        'For votes: 1\n'
+        'For votes: 2\n'
+        'Individual: Jane Doe\n'
+        'Director Votes For: 3\n'
+        'Director Votes For: 4\n'
+    )
+    proposals, directors = parse_document(text)
+    assert proposals['Vote Results - For'] == [1]
+    assert directors['Director Votes For'] == [3]
+
+
+def test_director_broker_line_does_not_fill_proposal_broker():
+    text = (
+        'Proposal Proxy Year: 2024\n'
+        'For votes: 1\n'
+        'Individual: Jane Doe\n'
+        'Director Votes Broker Non-Votes: 300\n'
+    )
+    proposals, directors = parse_document(text)
+    assert proposals['Vote Results - Broker Non-Votes'] == [None]
+    assert directors['Director Votes Broker-Non-Votes'] == [300]
+
+
+def test_nil_and_dash_broker_non_votes_become_zero():
+    text = (
+        'Proposal Proxy Year: 2024\n'
+        'Broker Non-Votes: Nil\n'
+        'Proposal Proxy Year: 2024\n'
+        'Broker Non-Votes: -\n'
+        'Individual: Jane Doe\n'
+        'Director Votes Broker-Non-Votes: Nil\n'
+        'Individual: John Roe\n'
+        'Director Votes Broker Non-Votes: -\n'
+    )
+    proposals, directors = parse_document(text)
+    assert proposals['Vote Results - Broker Non-Votes'] == [0, 0]
+    assert directors['Director Votes Broker-Non-Votes'] == [0, 0]
+
+
+def test_vote_columns_are_ints_or_none():
+    text = (
+        'Proposal Proxy Year: 2024\n'
+        'For votes: 1,234,567\n'
+        'Withheld votes: 0\n'
+        'Individual: Jane Doe\n'
+        'Director Votes Withheld: 12\n'
+    )
+    proposals, directors = parse_document(text)
+    assert proposals['Vote Results - For'] == [1234567]
+    assert proposals['Vote Results - Against'] == [None]
+    assert proposals['Vote Results - Abstained'] == [None]
+    assert proposals['Vote Results - Withheld'] == [0]
+    assert proposals['Vote Results - Broker Non-Votes'] == [None]
+    assert type(proposals['Vote Results - For'][0]) is int
+    assert directors['Director Votes For'] == [None]
+    assert directors['Director Votes Withheld'] == [12]
+    assert type(directors['Director Votes Withheld'][0]) is int
+
+
+def test_save_to_excel_writes_numeric_cells_in_row_order():
+    text = (
+        'Proposal Proxy Year: 2024\n'
+        'Proposal Text: "Elect the board"\n'
+        'For votes: 1,000\n'
+        'Against votes: 10\n'
+        'Proposal Proxy Year: 2024\n'
+        'For votes: 5\n'
+        'Individual: Jane Doe\n'
+        'Director Votes For: 500\n'
+        'Director Votes Broker Non-Votes: Nil\n'
+    )
+    archive = zipfile.ZipFile(BytesIO(save_to_excel(*parse_document(text))))
+    # constant_memory mode writes strings inline instead of to a shared string table
+    assert 'xl/sharedStrings.xml' not in archive.namelist()
+    proposals = _sheet_cells(archive, 'xl/worksheets/sheet1.xml')
+    directors = _sheet_cells(archive, 'xl/worksheets/sheet2.xml')
+    assert [proposals[f'{col}1'] for col in 'ABCDEFGHIJ'] == PROPOSAL_COLUMNS
+    assert [directors[f'{col}1'] for col in 'ABCDEFG'] == DIRECTOR_COLUMNS
+    # Every column of every row survives; blank values are left as empty cells
+    assert {ref: val for ref, val in proposals.items() if ref[1:] != '1'} == {
+        'A2': '2024', 'B2': 'Approved (1,000 For > 10 Against)', 'C2': 'Elect the board',
+        'E2': 1000, 'F2': 10,
+        'A3': '2024', 'B3': 'Approved (5 For >  Against)', 'E3': 5,
+    }
+    assert {ref: val for ref, val in directors.items() if ref[1:] != '1'} == {
+        'A2': '2024', 'B2': 'Jane Doe', 'C2': 500, 'G2': 0,
+    }